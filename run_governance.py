@@ -2,6 +2,8 @@ import json
 import os
 import sys
 from src.governance.engine import GovernanceEngine
+from src.governance.loader import load_json
+from src.governance.hashing import SHA256_BACKEND
 from src.governance.schema import get_schema_version_hash
 
 def main():
@@ -19,6 +21,8 @@ def main():
         engine = GovernanceEngine(manifest_path)
         print(f"[*] Governance Engine Initialized.")
         print(f"[*] Governance Version: {engine.governance_version}")
+        print(f"[*] Governance Hash Algorithm: {engine.governance_hash_algorithm}")
+        print(f"[*] SHA256 Backend: {SHA256_BACKEND}")
         print(f"[*] Expected Schema Version: {get_schema_version_hash()}")
     except Exception as e:
         print(f"[!] FATAL: Engine Initialization Failed: {e}")
@@ -35,8 +39,7 @@ def main():
     print(f"[*] Loading Plan: {plan_path}")
 
     try:
-        with open(plan_path, 'r') as f:
-            plan = json.load(f)
+        plan = load_json(plan_path)
     except Exception as e:
         print(f"[!] FATAL: Could not load plan JSON: {e}")
         sys.exit(1)
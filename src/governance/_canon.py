@@ -0,0 +1,236 @@
+"""
+RFC 8785 (JCS) canonical walker, byte-identical to jcs.canonicalize.
+
+Written in plain typed Python so it can be compiled with mypyc:
+
+    mypyc src/governance/_canon.py
+
+hashing.py uses this walker as its general backend; the compiled extension
+shadows this file on import. jcs remains the reference it is checked against
+(tests/check_canonical.py).
+"""
+import io
+from json.encoder import encode_basestring  # C-accelerated string escaping
+from typing import Any, Callable, Dict, List, Optional
+
+# Pending string fragments buffered before one UTF-8 encode + write
+_FLUSH_PARTS = 2048
+
+def _es6_number(value: Any) -> str:
+    """
+    ES6 Number.prototype.toString() of a JSON number (RFC 8785 section 3.2.2.3).
+    Integers are rendered through IEEE-754 doubles, exactly like jcs.
+    """
+    f = float(value)
+    if f != f or f in (float("inf"), float("-inf")):
+        raise ValueError(f"Invalid JSON number: {f!r}")
+    if f == 0:
+        return "0"
+
+    # repr() yields the shortest round-trip digits, as ES6 requires
+    text = repr(f)
+    sign = ""
+    if text[0] == "-":
+        sign = "-"
+        text = text[1:]
+    exponent = 0
+    if "e" in text:
+        text, exp_text = text.split("e")
+        exponent = int(exp_text)
+    if "." in text:
+        int_part, frac_part = text.split(".")
+    else:
+        int_part, frac_part = text, ""
+
+    # value = 0.<digits> * 10**point
+    digits = int_part + frac_part
+    point = len(int_part) + exponent
+    stripped = digits.lstrip("0")
+    point -= len(digits) - len(stripped)
+    digits = stripped.rstrip("0")
+    k = len(digits)
+
+    if k <= point <= 21:
+        return sign + digits + "0" * (point - k)
+    if 0 < point <= 21:
+        return sign + digits[:point] + "." + digits[point:]
+    if -6 < point <= 0:
+        return sign + "0." + "0" * -point + digits
+    e = point - 1
+    mantissa = digits[0] + ("." + digits[1:] if k > 1 else "")
+    return sign + mantissa + ("e+" if e > 0 else "e-") + str(abs(e))
+
+def _sorted_keys(d: Dict[Any, Any]) -> List[str]:
+    """
+    JCS orders members by UTF-16 code units. For ASCII keys (the norm for
+    plans) that is plain code point order, so the costly key function is
+    only paid when a non-ASCII key is present.
+    """
+    keys = list(d)
+    if "".join(keys).isascii():
+        keys.sort()
+    else:
+        keys.sort(key=lambda k: k.encode("utf-16_be"))
+    return keys
+
+class _Sink:
+    """
+    Buffers canonical fragments and hands them to `write` as UTF-8 chunks,
+    so consumers (e.g. hasher.update) never see the whole document at once.
+    """
+
+    def __init__(self, write: Callable[[bytes], Any]) -> None:
+        self.parts: List[str] = []
+        self.write = write
+
+    def flush(self) -> None:
+        if self.parts:
+            self.write("".join(self.parts).encode("utf-8"))
+            self.parts.clear()
+
+# Exact JSON-native types. Walkers dispatch on type() identity, which skips
+# the MRO walk isinstance() pays per node, and call json_kind() only for
+# types outside this set.
+JSON_TYPES = frozenset((dict, list, tuple, str, int, float, bool, type(None)))
+
+def json_kind(obj: Any) -> Optional[type]:
+    """
+    JSON-native type of an object whose type is not in JSON_TYPES: the
+    builtin a subclass derives from (OrderedDict -> dict, IntEnum -> int),
+    or None for non-JSON objects (datetime, UUID, ...).
+    """
+    for base in (dict, list, tuple, str, int, float):
+        if isinstance(obj, base):
+            return base
+    return None
+
+def _encode(obj: Any, sink: _Sink) -> None:
+    parts = sink.parts
+    t: Optional[type] = type(obj)
+    if t not in JSON_TYPES:
+        t = json_kind(obj)
+        if t is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    if t is str:
+        parts.append(encode_basestring(obj))
+    elif obj is None:
+        parts.append("null")
+    elif obj is True:
+        parts.append("true")
+    elif obj is False:
+        parts.append("false")
+    elif t is int or t is float:
+        parts.append(_es6_number(obj))
+    elif t is list or t is tuple:
+        if not obj:
+            parts.append("[]")
+            return
+        parts.append("[")
+        first = True
+        for item in obj:
+            if first:
+                first = False
+            else:
+                parts.append(",")
+            _encode(item, sink)
+            if len(parts) >= _FLUSH_PARTS:
+                sink.flush()
+        parts.append("]")
+    else:  # dict
+        if not obj:
+            parts.append("{}")
+            return
+        parts.append("{")
+        first = True
+        for key in _sorted_keys(obj):
+            if first:
+                first = False
+            else:
+                parts.append(",")
+            parts.append(encode_basestring(key))
+            parts.append(":")
+            _encode(obj[key], sink)
+            if len(parts) >= _FLUSH_PARTS:
+                sink.flush()
+        parts.append("}")
+
+class SchemaLayout:
+    """
+    Precomputed member layout of a closed JSON Schema object: one whose
+    properties are all required and additionalProperties is false. Every
+    conforming instance then has exactly these keys, so their JCS order and
+    escaped '"key":' prefixes are fixed and need not be sorted per call.
+    """
+
+    def __init__(self, keys: List[str], children: Dict[str, "SchemaLayout"]) -> None:
+        self.keys = _sorted_keys(dict.fromkeys(keys))
+        self.prefixes: List[str] = [
+            ("{" if i == 0 else ",") + encode_basestring(k) + ":"
+            for i, k in enumerate(self.keys)
+        ]
+        self.children = children
+
+def layout_from_schema(schema: Dict[str, Any]) -> Optional["SchemaLayout"]:
+    """
+    Returns the SchemaLayout for a closed object schema, or None when the
+    schema leaves the key set open (generic sorting applies there).
+    """
+    if schema.get("type") != "object" or schema.get("additionalProperties") is not False:
+        return None
+    properties = schema.get("properties", {})
+    if not properties or set(schema.get("required", [])) != set(properties):
+        return None
+    children: Dict[str, SchemaLayout] = {}
+    for key, sub_schema in properties.items():
+        child = layout_from_schema(sub_schema)
+        if child is not None:
+            children[key] = child
+    return SchemaLayout(list(properties), children)
+
+def _encode_layout(obj: Any, layout: SchemaLayout, sink: _Sink) -> None:
+    keys = layout.keys
+    # Any deviation from the declared key set falls back to generic JCS
+    if not isinstance(obj, dict) or len(obj) != len(keys):
+        _encode(obj, sink)
+        return
+    for key in keys:
+        if key not in obj:
+            _encode(obj, sink)
+            return
+    parts = sink.parts
+    children = layout.children
+    for key, prefix in zip(keys, layout.prefixes):
+        parts.append(prefix)
+        child = children.get(key)
+        if child is None:
+            _encode(obj[key], sink)
+        else:
+            _encode_layout(obj[key], child, sink)
+        if len(parts) >= _FLUSH_PARTS:
+            sink.flush()
+    parts.append("}")
+
+def canonicalize_into(
+    obj: Any,
+    write: Callable[[bytes], Any],
+    layout: Optional[SchemaLayout] = None
+) -> None:
+    """
+    Streams the RFC 8785 canonical UTF-8 bytes of `obj` into `write`.
+    An optional SchemaLayout skips key sorting for schema-conforming objects;
+    the bytes are identical either way.
+    """
+    sink = _Sink(write)
+    if layout is None:
+        _encode(obj, sink)
+    else:
+        _encode_layout(obj, layout, sink)
+    sink.flush()
+
+def canonicalize(obj: Any) -> bytes:
+    """
+    Returns the RFC 8785 canonical UTF-8 bytes of a JSON-compatible object.
+    """
+    buffer = io.BytesIO()
+    canonicalize_into(obj, buffer.write)
+    return buffer.getvalue()
@@ -1,12 +1,56 @@
+import copy
+import functools
+import hashlib
 import json
 import os
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import AbstractSet, Dict, Any, FrozenSet, List, Optional, Tuple
 
-from .hashing import GovernanceHasher
+from .hashing import GovernanceHasher, resolve_governance_hash_algorithm
+from .loader import load_json
 from .schema import ARCHITECTURE_CONTRACT_SCHEMA, get_schema_version_hash
 from .reviewer import ReviewerGate, ReviewResult
 
+REVIEWER_SOURCE_PATH = os.path.join(os.path.dirname(__file__), 'reviewer.py')
+
+@functools.lru_cache(maxsize=8)
+def _read_reviewer_source(path: str, mtime_ns: int) -> bytes:
+    """
+    Reads the raw Reviewer source bytes once per (path, mtime).
+    An edit to reviewer.py bumps mtime and forces a fresh read.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _verdict_digest(plan: Any) -> str:
+    """
+    SHA256 over a type-tagged, order-preserving walk of a plan object.
+    Unlike the canonical plan hash it tells apart key orders and Python
+    types (tuple vs list, 1 vs 1.0), both of which can change a verdict.
+    Iterative, so deeply nested plans cannot exhaust the recursion limit.
+    """
+    hasher = hashlib.sha256()
+    stack: List[Any] = [plan]
+    while stack:
+        node = stack.pop()
+        type_name = type(node).__qualname__
+        if isinstance(node, dict):
+            hasher.update(f"{type_name}{{{len(node)}".encode())
+            for key, value in reversed(list(node.items())):
+                stack.append(value)
+                stack.append(key)
+        elif isinstance(node, (list, tuple)):
+            hasher.update(f"{type_name}[{len(node)}".encode())
+            stack.extend(reversed(node))
+        else:
+            text = node if isinstance(node, str) else repr(node)
+            data = text.encode("utf-8", "surrogatepass")
+            hasher.update(f"{type_name}:{len(data)}:".encode())
+            hasher.update(data)
+    return hasher.hexdigest()
+
 # ---------------------------------------------------------
 # GOVERNANCE ENGINE
 # ---------------------------------------------------------
@@ -21,42 +65,74 @@ class GovernanceEngine:
     - Issues Decrees (Freeze/Reject)
     """
 
+    # Max verdicts kept per engine (LRU, keyed by governance + plan digest)
+    VERDICT_CACHE_SIZE = 1024
+
     def __init__(self, manifest_path: str):
         self.manifest_path = manifest_path
         self.manifest = self._load_manifest()
         self.reviewer = ReviewerGate(self.manifest)
+
+        # Section dependencies are fixed by the Manifest: resolve them once.
+        # Ordered tuples keep the reported missing section deterministic.
+        self._dep_required: Dict[str, Tuple[str, ...]] = {
+            check_id: tuple(dict.fromkeys(s for s in sections if s != "*"))
+            for check_id, sections in self.manifest.get("check_section_dependencies", {}).items()
+        }
+        self._dep_required_all: FrozenSet[str] = frozenset(
+            s for sections in self._dep_required.values() for s in sections
+        )
+
+        # Manifest and Schema are immutable after load: canonicalize once
+        self._manifest_bytes = GovernanceHasher.canonicalize(self.manifest)
+        self._schema_bytes = GovernanceHasher.canonicalize(ARCHITECTURE_CONTRACT_SCHEMA)
         
+        # Governance hash algorithm: GOVERNANCE_HASH=sha256|blake3|auto
+        self.governance_hash_algorithm = resolve_governance_hash_algorithm(
+            os.environ.get("GOVERNANCE_HASH", "sha256")
+        )
+
+        # Tagged Manifest + Schema prefix, hashed once and cloned per version
+        self._gov_prefix_hasher = GovernanceHasher.governance_prefix_hasher(
+            self._manifest_bytes,
+            self._schema_bytes,
+            self.governance_hash_algorithm
+        )
+
         # Calculate the immutable Governance Version Hash at startup
         self.governance_version = self._compute_governance_version_hash()
 
+        # Key order of schema-conforming plans, fixed by the Schema AST
+        self._plan_layout = GovernanceHasher.schema_layout(ARCHITECTURE_CONTRACT_SCHEMA)
+
+        # Verdicts are a pure function of (plan, governance): memoize them.
+        # The lock keeps the LRU bookkeeping consistent across threads.
+        self._verdict_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._verdict_lock = threading.Lock()
+
     def _load_manifest(self) -> Dict[str, Any]:
         """
         Loads the system-owned manifest. 
         Planner has NO access to modify this runtime object.
         """
-        with open(self.manifest_path, 'r') as f:
-            return json.load(f)
+        return load_json(self.manifest_path)
 
     def _compute_governance_version_hash(self) -> str:
         """
         Computes the cryptographically bound version of the Governance Layer.
-        Hash = SHA256( Manifest + Schema + ReviewerSourceCode )
+        Hash = H( Manifest + Schema + ReviewerSourceCode ), H = governance_hash_algorithm
         """
-        # 1. Manifest Hash
-        manifest_canonical = self.manifest
-
-        # 2. Schema Hash
-        schema_canonical = ARCHITECTURE_CONTRACT_SCHEMA
+        # 1. + 2. Tagged Manifest & Schema prefix (hashed in __init__)
 
         # 3. Reviewer Logic Hash (Proxy for AST)
-        reviewer_source_path = os.path.join(os.path.dirname(__file__), 'reviewer.py')
-        with open(reviewer_source_path, 'r') as f:
-            reviewer_logic_str = f.read()
-
-        return GovernanceHasher.compute_governance_version(
-            manifest_canonical,
-            schema_canonical,
-            reviewer_logic_str
+        reviewer_logic_bytes = _read_reviewer_source(
+            REVIEWER_SOURCE_PATH,
+            os.stat(REVIEWER_SOURCE_PATH).st_mtime_ns
+        )
+
+        return GovernanceHasher.finalize_governance_version(
+            self._gov_prefix_hasher,
+            reviewer_logic_bytes
         )
 
     def _verify_self_consistency(self, plan: Dict[str, Any]) -> Optional[str]:
@@ -64,18 +140,18 @@ class GovernanceEngine:
         Risk #3 Fix: Mandatory Self-Verification.
         Ensures that the Governance Manifest rules don't depend on phantom fields.
         """
-        dependencies = self.manifest.get("check_section_dependencies", {})
-        
         # Flatten available sections in the plan for lookup
         # We look at Top-Level Keys AND keys inside 'invariants'
-        available_sections = set(plan.keys())
+        available_sections: AbstractSet[str] = plan.keys()
         if "invariants" in plan and isinstance(plan["invariants"], dict):
-            available_sections.update(plan["invariants"].keys())
-            
-        for check_id, required_sections in dependencies.items():
+            available_sections = plan.keys() | plan["invariants"].keys()
+
+        # Fast path: every dependency satisfied in a single set comparison
+        if self._dep_required_all.issubset(available_sections):
+            return None
+
+        for check_id, required_sections in self._dep_required.items():
             for section in required_sections:
-                if section == "*":
-                    continue
                 if section not in available_sections:
                     return f"Governance Config Error: Check '{check_id}' depends on missing section '{section}'."
         return None
@@ -85,9 +161,38 @@ class GovernanceEngine:
         The Main Public API.
         Input: Candidate Architecture Contract
         Output: Governance Event (PLAN_FROZEN or PLAN_REJECTED)
+        Repeated submissions of an identical plan reuse the cached verdict.
         """
         timestamp = int(time.time())
 
+        cache_key = f"{self.governance_version}:{_verdict_digest(plan)}"
+        with self._verdict_lock:
+            cached = self._verdict_cache.get(cache_key)
+            if cached is not None:
+                self._verdict_cache.move_to_end(cache_key)
+
+        if cached is None:
+            event = self._evaluate_uncached(plan, timestamp)
+            # Store without the caller's plan object; it is re-attached on hit
+            entry = copy.deepcopy({k: v for k, v in event.items() if k != "frozen_artifact"})
+            with self._verdict_lock:
+                self._verdict_cache[cache_key] = entry
+                self._verdict_cache.move_to_end(cache_key)
+                if len(self._verdict_cache) > self.VERDICT_CACHE_SIZE:
+                    self._verdict_cache.popitem(last=False)
+            return event
+
+        # Cached entries are never mutated, so copying needs no lock
+        event = copy.deepcopy(cached)
+        event["timestamp"] = timestamp
+        if event["authority_granted"]:
+            event["frozen_artifact"] = plan
+        return event
+
+    def _evaluate_uncached(self, plan: Dict[str, Any], timestamp: int) -> Dict[str, Any]:
+        """
+        Runs the full governance pipeline for one plan.
+        """
         # 0. PRE-FLIGHT: Self-Consistency Check
         consistency_error = self._verify_self_consistency(plan)
         if consistency_error:
@@ -95,6 +200,7 @@ class GovernanceEngine:
                 "event_type": "PLAN_REJECTED",
                 "timestamp": timestamp,
                 "governance_version": self.governance_version,
+                "governance_hash_algorithm": self.governance_hash_algorithm,
                 "status": "FAIL_GOVERNANCE_CONFIG",
                 "authority_granted": False,
                 "error_count": 1,
@@ -114,12 +220,13 @@ class GovernanceEngine:
         if result.admissible:
             # --- FREEZE PATH ---
             # Authority granted.
-            plan_hash = GovernanceHasher.compute_sha256(plan)
+            plan_hash = GovernanceHasher.compute_sha256(plan, self._plan_layout)
             
             return {
                 "event_type": "PLAN_FROZEN",
                 "timestamp": timestamp,
                 "governance_version": self.governance_version,
+                "governance_hash_algorithm": self.governance_hash_algorithm,
                 "plan_hash": plan_hash,
                 "schema_version": plan.get("schema_version"),
                 "status": "ADMISSIBLE",
@@ -134,17 +241,11 @@ class GovernanceEngine:
                 "event_type": "PLAN_REJECTED",
                 "timestamp": timestamp,
                 "governance_version": self.governance_version,
+                "governance_hash_algorithm": self.governance_hash_algorithm,
                 "status": "REJECTED",
                 "authority_granted": False,
                 "error_count": len(result.errors),
-                "errors": [
-                    {
-                        "check_id": err.check_id,
-                        "section": err.section,
-                        "message": err.message,
-                        "reference": err.reference
-                    } for err in result.errors
-                ],
+                "errors": [err._asdict() for err in result.errors],
                 "locked_sections": result.locked_sections,
                 "remediation": "Planner must correct errors without modifying locked sections."
             }
\ No newline at end of file
@@ -1,6 +1,143 @@
 import hashlib
-import jcs  # RFC 8785 implementation
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
+
+from . import _canon  # Typed JCS walker; a mypyc build shadows the .py
+from ._canon import JSON_TYPES, json_kind
+
+orjson: Any
+try:
+    import orjson  # Optional C-accelerated serializer
+except ImportError:
+    orjson = None
+
+blake3: Any
+try:
+    from blake3 import blake3  # Optional SIMD hash for governance_version
+except ImportError:
+    blake3 = None
+
+# ---------------------------------------------------------
+# SHA256 BACKEND
+# ---------------------------------------------------------
+# OpenSSL-backed hashlib uses SHA-NI / ARMv8 SHA extensions when the CPU
+# offers them; the builtin fallback (_sha256) is scalar C. New hashers are
+# cloned from a prototype, which skips the per-call digest lookup.
+
+_SHA256_PROTO = hashlib.sha256()
+if _SHA256_PROTO.name != "sha256":
+    raise ImportError(f"hashlib.sha256 resolved to '{_SHA256_PROTO.name}'")
+SHA256_BACKEND = "openssl" if type(_SHA256_PROTO).__module__ == "_hashlib" else "builtin"
+
+def _new_sha256():
+    return _SHA256_PROTO.copy()
+
+# ---------------------------------------------------------
+# GOVERNANCE HASH ALGORITHM
+# ---------------------------------------------------------
+# Plan hashes are always SHA256 (external artifact identity).
+# The internal governance_version composite may use BLAKE3.
+
+SUPPORTED_GOVERNANCE_HASHES = ("sha256", "blake3")
+
+def resolve_governance_hash_algorithm(requested: str) -> str:
+    """
+    Maps a GOVERNANCE_HASH setting (sha256 | blake3 | auto) to a concrete
+    algorithm. 'auto' prefers BLAKE3 when installed. Fails hard on
+    unknown names or a missing blake3 package.
+    """
+    requested = requested.strip().lower()
+    if requested == "auto":
+        return "blake3" if blake3 is not None else "sha256"
+    if requested not in SUPPORTED_GOVERNANCE_HASHES:
+        raise ValueError(f"Unsupported governance hash algorithm '{requested}'")
+    if requested == "blake3" and blake3 is None:
+        raise ValueError("Governance hash 'blake3' requested but the blake3 package is not installed")
+    return requested
+
+# Domain-separation tags: one per governance_version segment. Canonical
+# JSON never contains a raw NUL, so the terminator also pins segment
+# boundaries (manifest bytes cannot impersonate the schema segment).
+TAG_MANIFEST = b"GOV-MANIFEST-V1\x00"
+TAG_SCHEMA = b"GOV-SCHEMA-V1\x00"
+TAG_LOGIC = b"GOV-LOGIC-V1\x00"
+
+def _new_governance_hasher(algorithm: str):
+    if algorithm == "blake3":
+        return blake3()
+    return _new_sha256()
+
+# ---------------------------------------------------------
+# CANONICALIZATION BACKEND (SELECTED AT IMPORT)
+# ---------------------------------------------------------
+
+# General-purpose walker (byte-identical to the jcs reference, ~3x faster
+# interpreted). A mypyc build of _canon speeds it up further.
+_GENERIC_IMPL: Callable[[Any], bytes] = _canon.canonicalize
+
+# Largest integer every IEEE-754 double can represent exactly
+_MAX_SAFE_INTEGER = 2 ** 53
+
+def _orjson_compatible(data: Any) -> bool:
+    """
+    True when orjson's sorted output is byte-identical to RFC 8785.
+    orjson diverges from JCS on three points only:
+    - floats (JCS uses ES6 number formatting, e.g. 1.0 -> 1)
+    - integers beyond 2**53 (JCS renders them as IEEE-754 doubles)
+    - keys outside the BMP (JCS sorts by UTF-16 code units)
+    Non-JSON objects (datetime, UUID, dataclasses, plain Enum members) are
+    also routed to the generic backend: orjson would serialize them, while
+    JCS must reject them.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        t: Optional[type] = type(node)
+        if t not in JSON_TYPES:
+            t = json_kind(node)
+            if t is None:
+                return False
+        if t is dict:
+            for k, v in node.items():
+                if type(k) is not str and not isinstance(k, str):
+                    return False
+                if not k.isascii() and max(k) > '\uffff':
+                    return False
+                stack.append(v)
+        elif t is list or t is tuple:
+            stack.extend(node)
+        elif t is float:
+            return False
+        elif t is int and not -_MAX_SAFE_INTEGER <= node <= _MAX_SAFE_INTEGER:
+            return False
+    return True
+
+def _orjson_bytes(data: Any) -> Optional[bytes]:
+    """
+    Canonical bytes rendered by orjson, or None when orjson is absent or
+    cannot render `data` as JCS (floats, non-BMP keys, integers beyond 2**53).
+    """
+    if orjson is None or not _orjson_compatible(data):
+        return None
+    try:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # orjson.JSONEncodeError subclasses TypeError
+        return None
+
+def _orjson_canonicalize(data: Any) -> bytes:
+    """
+    orjson fast path with generic fallback for inputs orjson cannot render as
+    JCS.
+    """
+    rendered = _orjson_bytes(data)
+    if rendered is not None:
+        return rendered
+    return _GENERIC_IMPL(data)
+
+if orjson is not None:
+    _CANONICALIZE_IMPL: Callable[[Any], bytes] = _orjson_canonicalize
+else:
+    _CANONICALIZE_IMPL = _GENERIC_IMPL
 
 class GovernanceHasher:
     """
@@ -8,6 +145,9 @@ class GovernanceHasher:
     reproducibility of plans and governance states.
     """
 
+    # Byte-identical to jcs.canonicalize; backend chosen once at import
+    _canonicalize_impl = staticmethod(_CANONICALIZE_IMPL)
+
     @staticmethod
     def canonicalize(data: Dict[str, Any]) -> bytes:
         """
@@ -15,37 +155,118 @@ class GovernanceHasher:
         This handles key sorting, spacing, and float representation deterministically.
         """
         try:
-            return jcs.canonicalize(data)
+            return GovernanceHasher._canonicalize_impl(data)
         except Exception as e:
             # Governance must fail hard on serialization errors
             raise ValueError(f"Canonicalization failed: {str(e)}")
 
     @staticmethod
-    def compute_sha256(data: Dict[str, Any]) -> str:
+    def schema_layout(schema: Dict[str, Any]) -> Optional[_canon.SchemaLayout]:
+        """
+        Precomputes the JCS member order of a schema's closed objects, for
+        use as `layout` below. None when the schema has no closed object.
+        """
+        return _canon.layout_from_schema(schema)
+
+    @staticmethod
+    def canonicalize_into(
+        data: Dict[str, Any],
+        write: Callable[[bytes], Any],
+        layout: Optional[_canon.SchemaLayout] = None
+    ) -> None:
+        """
+        Emits the RFC 8785 canonical bytes of a dictionary through `write`.
+        The _canon walker streams them chunk by chunk, skipping key sorting
+        where `layout` fixes the order; documents orjson can render arrive
+        as a single chunk. The concatenated output always equals
+        canonicalize(data).
+        """
+        try:
+            rendered = _orjson_bytes(data)
+            if rendered is not None:
+                write(rendered)
+                return
+            _canon.canonicalize_into(data, write, layout)
+        except Exception as e:
+            # Governance must fail hard on serialization errors
+            raise ValueError(f"Canonicalization failed: {str(e)}")
+
+    @staticmethod
+    def compute_sha256(
+        data: Dict[str, Any],
+        layout: Optional[_canon.SchemaLayout] = None
+    ) -> str:
         """
         Returns the SHA256 hex digest of the canonicalized data.
+        Canonical bytes are fed to the hasher as they are produced.
         """
-        canonical_bytes = GovernanceHasher.canonicalize(data)
-        return hashlib.sha256(canonical_bytes).hexdigest()
+        hasher = _new_sha256()
+        GovernanceHasher.canonicalize_into(data, hasher.update, layout)
+        return hasher.hexdigest()
 
     @staticmethod
     def compute_governance_version(
         manifest: Dict[str, Any],
         schema_ast: Dict[str, Any],
-        reviewer_logic_version: str
+        reviewer_logic_bytes: bytes,
+        algorithm: str = "sha256"
     ) -> str:
         """
         Computes the Immutable Governance Version Hash.
-        Formula: SHA256( canonical(Manifest) + canonical(Schema) + ReviewerLogicString )
+        Formula: H( TAG_MANIFEST + canonical(Manifest) + TAG_SCHEMA + canonical(Schema)
+                    + TAG_LOGIC + ReviewerLogicBytes )
+        H is SHA256 by default, or BLAKE3 (see resolve_governance_hash_algorithm).
+        Reviewer logic is hashed as raw source bytes (no decode/encode round-trip).
         """
         manifest_bytes = GovernanceHasher.canonicalize(manifest)
         schema_bytes = GovernanceHasher.canonicalize(schema_ast)
-        logic_bytes = reviewer_logic_version.encode('utf-8')
 
-        # Combined hash for total system state
-        hasher = hashlib.sha256()
+        return GovernanceHasher.compute_governance_version_from_bytes(
+            manifest_bytes,
+            schema_bytes,
+            reviewer_logic_bytes,
+            algorithm
+        )
+
+    @staticmethod
+    def compute_governance_version_from_bytes(
+        manifest_bytes: bytes,
+        schema_bytes: bytes,
+        logic_bytes: bytes,
+        algorithm: str = "sha256"
+    ) -> str:
+        """
+        Same formula as compute_governance_version, but over inputs that are
+        already canonical. Lets callers canonicalize immutable state once.
+        """
+        prefix = GovernanceHasher.governance_prefix_hasher(manifest_bytes, schema_bytes, algorithm)
+        return GovernanceHasher.finalize_governance_version(prefix, logic_bytes)
+
+    @staticmethod
+    def governance_prefix_hasher(
+        manifest_bytes: bytes,
+        schema_bytes: bytes,
+        algorithm: str = "sha256"
+    ):
+        """
+        Returns a hasher pre-filled with the tagged Manifest + Schema segments.
+        These rarely change: keep the hasher and finalize copies of it.
+        """
+        hasher = _new_governance_hasher(algorithm)
+        hasher.update(TAG_MANIFEST)
         hasher.update(manifest_bytes)
+        hasher.update(TAG_SCHEMA)
         hasher.update(schema_bytes)
+        return hasher
+
+    @staticmethod
+    def finalize_governance_version(prefix_hasher, logic_bytes: bytes) -> str:
+        """
+        Appends the tagged Reviewer logic segment to a copy of the prefix
+        hasher. The prefix state itself is left untouched for reuse.
+        """
+        # Combined hash for total system state
+        hasher = prefix_hasher.copy()
+        hasher.update(TAG_LOGIC)
         hasher.update(logic_bytes)
-        
-        return hasher.hexdigest()
\ No newline at end of file
+        return hasher.hexdigest()
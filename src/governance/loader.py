@@ -0,0 +1,20 @@
+import json
+from typing import Any
+
+from .hashing import orjson  # Optional fast JSON parser (None when absent)
+
+def load_json(path: str) -> Any:
+    """
+    Parses a JSON file, using orjson when installed.
+    Documents orjson refuses but stdlib json accepts (NaN literals,
+    integers beyond 64 bits) are re-parsed with json, so results match.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw)
+    with open(path, 'r') as f:
+        return json.load(f)
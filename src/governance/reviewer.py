@@ -1,12 +1,37 @@
 import re
 import jsonschema
-from typing import Dict, List, Any, Set, Tuple, Optional
+from typing import Dict, List, Any, NamedTuple, Set, Tuple, Optional
 from dataclasses import dataclass, field
 
 from .schema import ARCHITECTURE_CONTRACT_SCHEMA, get_schema_version_hash
 
-@dataclass
-class ReviewError:
+# ---------------------------------------------------------
+# SYNTACTIC GRAMMARS (COMPILED ONCE PER PROCESS)
+# ---------------------------------------------------------
+# Every pattern is anchored and free of nested quantifiers, so matching is
+# linear in the input length (no catastrophic backtracking). Stdlib `re` is
+# kept deliberately: RE2 treats `$` and `\w` differently, and the verdict
+# must not depend on which regex engine happens to be installed.
+
+# Risk #2 Fix: Protocol-agnostic syntactic validation
+# Allows 'http://', 'ftp://', 'postgres://' etc. 
+REGEX_URL = re.compile(r'^(?:[a-z][a-z0-9+.-]*://[\w.-]+|N/A).*')
+
+REGEX_MODULE = re.compile(r'^[a-zA-Z0-9_.]+$')
+REGEX_PACKAGE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# RG-REFERENCE-003: Strict Identifier Grammar
+# Keys in referenceable domains must be clean (no spaces, no weird chars)
+REGEX_IDENTIFIER = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# Invariant domains whose keys are referenceable identifiers (checked in order)
+REFERENCE_DOMAINS: Tuple[str, ...] = ("api_contracts", "data_schemas")
+
+# Weak-format labels, in the order their errors are reported
+WEAK_FORMAT_LABELS: Tuple[str, ...] = ("url", "module", "package")
+
+class ReviewError(NamedTuple):
+    # Immutable tuple record: one allocation per error, no per-instance __dict__
     check_id: str
     section: str
     message: str
@@ -28,17 +53,33 @@ class ReviewerGate:
         self.manifest = manifest
         self.max_errors = manifest.get("max_errors", 5)
         self.weak_format_rules = manifest.get("weak_format_allowlists", {})
-        
-        # Risk #2 Fix: Protocol-agnostic syntactic validation
-        # Allows 'http://', 'ftp://', 'postgres://' etc. 
-        self.regex_url = re.compile(r'^(?:[a-z][a-z0-9+.-]*://[\w.-]+|N/A).*')
-        
-        self.regex_module = re.compile(r'^[a-zA-Z0-9_.]+$') 
-        self.regex_package = re.compile(r'^[a-zA-Z0-9_-]+$')
-        
-        # RG-REFERENCE-003: Strict Identifier Grammar
-        # Keys in referenceable domains must be clean (no spaces, no weird chars)
-        self.regex_identifier = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+        # Module-level grammars, exposed per instance for the checks below
+        self.regex_url = REGEX_URL
+        self.regex_module = REGEX_MODULE
+        self.regex_package = REGEX_PACKAGE
+        self.regex_identifier = REGEX_IDENTIFIER
+
+        # RG-WEAK-FORMAT-005: Allowlists as frozensets (O(1) membership, duplicates collapsed)
+        self._url_fields = frozenset(self.weak_format_rules.get("url_fields", []))
+        self._module_path_fields = frozenset(self.weak_format_rules.get("module_path_fields", []))
+        self._package_name_fields = frozenset(self.weak_format_rules.get("package_name_fields", []))
+
+        # field -> (regex, label) rules, resolved in one lookup.
+        # A field allow-listed under several labels is checked against each.
+        self._weak_rules: Dict[str, Tuple[Tuple[re.Pattern, str], ...]] = {}
+        for fields, regex, label in (
+            (self._url_fields, self.regex_url, "url"),
+            (self._module_path_fields, self.regex_module, "module"),
+            (self._package_name_fields, self.regex_package, "package"),
+        ):
+            for field_name in fields:
+                self._weak_rules[field_name] = self._weak_rules.get(field_name, ()) + ((regex, label),)
+
+        # RG-SCHEMA-001: The Schema AST is a module constant.
+        # Build the validator and expected version once, not per evaluation.
+        self._expected_schema_version = get_schema_version_hash()
+        self._validator = jsonschema.Draft7Validator(ARCHITECTURE_CONTRACT_SCHEMA)
 
     def evaluate(self, contract: Dict[str, Any]) -> ReviewResult:
         """
@@ -57,17 +98,27 @@ class ReviewerGate:
                 locked_sections=[]
             )
 
+        # Checks 3.-5. stop collecting at max_errors (per domain / label where
+        # errors are grouped): a heavily broken plan costs no more error
+        # bookkeeping than one with max_errors faults. Every section with a
+        # fault still keeps at least one error, so the locked sections below
+        # are the same as with uncapped checks. Check 2. needs no cap: the
+        # schema closes 'invariants' to a fixed set of domains.
+
+        # 2.-4. One fused walk over 'invariants'; results keep check precedence
+        invariant_errors, reference_errors, weak_errors = self._scan_invariants(contract)
+
         # 2. Invariant & Assumption Presence (RG-INVARIANT-002)
         if len(errors) < self.max_errors:
-            errors.extend(self._check_invariants(contract))
+            errors.extend(invariant_errors)
 
         # 3. Reference & Identifier Integrity (RG-REFERENCE-003) - [NOW IMPLEMENTED]
         if len(errors) < self.max_errors:
-            errors.extend(self._check_references(contract))
+            errors.extend(reference_errors)
 
         # 4. Weak Format Validation (RG-WEAK-FORMAT-005)
         if len(errors) < self.max_errors:
-            errors.extend(self._check_weak_formats(contract))
+            errors.extend(weak_errors)
 
         # 5. DAG Validation (RG-DAG-004)
         if len(errors) < self.max_errors:
@@ -84,7 +135,7 @@ class ReviewerGate:
 
     def _check_schema(self, contract: Dict[str, Any]) -> List[ReviewError]:
         errors = []
-        expected_version = get_schema_version_hash()
+        expected_version = self._expected_schema_version
         declared_version = contract.get("schema_version")
         
         if declared_version != expected_version:
@@ -94,8 +145,7 @@ class ReviewerGate:
                 message=f"Version mismatch. Expected {expected_version}, got {declared_version}"
             ))
 
-        validator = jsonschema.Draft7Validator(ARCHITECTURE_CONTRACT_SCHEMA)
-        for err in validator.iter_errors(contract):
+        for err in self._validator.iter_errors(contract):
             errors.append(ReviewError(
                 check_id="RG-SCHEMA-001",
                 section="structure",
@@ -106,72 +156,103 @@ class ReviewerGate:
                 break
         return errors
 
-    def _check_invariants(self, contract: Dict[str, Any]) -> List[ReviewError]:
-        errors = []
-        invariants = contract.get("invariants", {})
-        for domain, content in invariants.items():
-            is_empty = False
-            if isinstance(content, str):
-                if len(content.strip()) == 0: is_empty = True
-            elif isinstance(content, (dict, list)):
-                if len(content) == 0: is_empty = True
-            elif content is None:
-                is_empty = True
-            
-            if is_empty:
-                errors.append(ReviewError(
-                    check_id="RG-INVARIANT-002",
-                    section=f"invariants.{domain}",
-                    message="Domain is declared but empty. Must have at least one entry/character."
-                ))
-        return errors
-
-    def _check_references(self, contract: Dict[str, Any]) -> List[ReviewError]:
+    def _scan_invariants(
+        self, contract: Dict[str, Any]
+    ) -> Tuple[List[ReviewError], List[ReviewError], List[ReviewError]]:
         """
-        RG-REFERENCE-003: Enforces strict identifier grammar on referenceable domains.
+        Single pre-order walk over 'invariants' serving three checks:
+        - RG-INVARIANT-002: top-level domains must be non-empty
+        - RG-REFERENCE-003: keys of referenceable domains must match the grammar
+        - RG-WEAK-FORMAT-005: allow-listed fields must match their regex
+        Returns the three error lists separately. Reference errors are capped
+        at max_errors per domain and weak-format errors at max_errors overall.
         """
-        errors = []
+        max_errors = self.max_errors
+        invariant_errors: List[ReviewError] = []
+        reference_errors: Dict[str, List[ReviewError]] = {d: [] for d in REFERENCE_DOMAINS}
+        weak_errors: Dict[str, List[ReviewError]] = {label: [] for label in WEAK_FORMAT_LABELS}
+        weak_full = 0
+        weak_rules = self._weak_rules
         invariants = contract.get("invariants", {})
-        target_domains = ["api_contracts", "data_schemas"]
-        
-        for domain in target_domains:
-            section = invariants.get(domain)
-            if isinstance(section, dict):
-                for key in section.keys():
-                    if not self.regex_identifier.match(key):
-                        errors.append(ReviewError(
-                            check_id="RG-REFERENCE-003",
-                            section=f"invariants.{domain}",
-                            message=f"Invalid identifier format '{key}'. Must match ^[a-zA-Z0-9_-]+$",
-                            reference=key
-                        ))
-        return errors
 
-    def _check_weak_formats(self, contract: Dict[str, Any]) -> List[ReviewError]:
-        errors = []
-        invariants = contract.get("invariants", {})
-        
-        def scan_and_validate(data: Any, target_keys: List[str], regex: re.Pattern, label: str):
-            if isinstance(data, dict):
-                for k, v in data.items():
-                    if k in target_keys and isinstance(v, str):
-                        if not regex.match(v):
-                             errors.append(ReviewError(
-                                check_id="RG-WEAK-FORMAT-005",
-                                section=f"weak_format.{label}",
-                                message=f"Value '{v}' invalid for field '{k}'",
-                                reference=k
+        # Stack entries: (key, value, is_domain). Domains are popped in
+        # document order, so domain-level checks keep their original order.
+        stack: List[Tuple[Any, Any, bool]] = [
+            (domain, content, True) for domain, content in reversed(list(invariants.items()))
+        ]
+        while stack:
+            k, v, is_domain = stack.pop()
+
+            if is_domain:
+                # RG-INVARIANT-002
+                is_empty = False
+                if isinstance(v, str):
+                    if len(v.strip()) == 0: is_empty = True
+                elif isinstance(v, (dict, list)):
+                    if len(v) == 0: is_empty = True
+                elif v is None:
+                    is_empty = True
+
+                if is_empty:
+                    invariant_errors.append(ReviewError(
+                        check_id="RG-INVARIANT-002",
+                        section=f"invariants.{k}",
+                        message="Domain is declared but empty. Must have at least one entry/character."
+                    ))
+
+                # Once the budget is spent here, evaluate() skips the later
+                # checks: only the remaining domains still need a look
+                if len(invariant_errors) >= max_errors:
+                    continue
+
+                # RG-REFERENCE-003
+                domain_errors = reference_errors.get(k)
+                if domain_errors is not None and isinstance(v, dict):
+                    for key in v.keys():
+                        if not self.regex_identifier.match(key):
+                            domain_errors.append(ReviewError(
+                                check_id="RG-REFERENCE-003",
+                                section=f"invariants.{k}",
+                                message=f"Invalid identifier format '{key}'. Must match ^[a-zA-Z0-9_-]+$",
+                                reference=key
                             ))
-                    else:
-                        scan_and_validate(v, target_keys, regex, label)
-            elif isinstance(data, list):
-                for item in data:
-                    scan_and_validate(item, target_keys, regex, label)
-
-        scan_and_validate(invariants, self.weak_format_rules.get("url_fields", []), self.regex_url, "url")
-        scan_and_validate(invariants, self.weak_format_rules.get("module_path_fields", []), self.regex_module, "module")
-        scan_and_validate(invariants, self.weak_format_rules.get("package_name_fields", []), self.regex_package, "package")
-        return errors
+                            if len(domain_errors) >= max_errors:
+                                break
+
+            # RG-WEAK-FORMAT-005 (once every label is full only domains matter)
+            if weak_full == len(weak_errors) or len(invariant_errors) >= max_errors:
+                continue
+            rules = weak_rules.get(k)
+            if rules and isinstance(v, str):
+                for regex, label in rules:
+                    label_errors = weak_errors[label]
+                    if len(label_errors) < max_errors and not regex.match(v):
+                        label_errors.append(ReviewError(
+                            check_id="RG-WEAK-FORMAT-005",
+                            section=f"weak_format.{label}",
+                            message=f"Value '{v}' invalid for field '{k}'",
+                            reference=k
+                        ))
+                        if len(label_errors) >= max_errors:
+                            weak_full += 1
+            elif isinstance(v, dict):
+                stack.extend((ck, cv, False) for ck, cv in reversed(list(v.items())))
+            elif isinstance(v, list):
+                stack.extend((None, item, False) for item in reversed(v))
+
+        # Reference errors are reported in REFERENCE_DOMAINS order
+        ordered_reference_errors = [
+            err for domain in REFERENCE_DOMAINS for err in reference_errors[domain]
+        ]
+        # Weak-format errors are grouped by label, in WEAK_FORMAT_LABELS order
+        ordered_weak_errors = [
+            err for label in WEAK_FORMAT_LABELS for err in weak_errors[label]
+        ]
+        return (
+            invariant_errors,
+            ordered_reference_errors,
+            ordered_weak_errors[:max_errors]
+        )
 
     def _check_dag(self, contract: Dict[str, Any]) -> List[ReviewError]:
         errors = []
@@ -181,7 +262,7 @@ class ReviewerGate:
 
         # RG-DAG-004 Part 2: Existence Check (The Hardening)
         build_deps = contract.get("invariants", {}).get("build_dependencies", {})
-        valid_nodes = set(build_deps.keys()) if isinstance(build_deps, dict) else set()
+        valid_nodes = frozenset(build_deps) if isinstance(build_deps, dict) else frozenset()
 
         for node in dag.keys():
             if node not in valid_nodes:
@@ -191,6 +272,8 @@ class ReviewerGate:
                     message=f"DAG node '{node}' is not defined in 'build_dependencies'.",
                     reference=node
                 ))
+                if len(errors) >= self.max_errors:
+                    return errors
             for target in dag[node]:
                 if target not in valid_nodes:
                     errors.append(ReviewError(
@@ -199,26 +282,35 @@ class ReviewerGate:
                         message=f"DAG target '{target}' (referenced by '{node}') is not defined in 'build_dependencies'.",
                         reference=target
                     ))
+                    if len(errors) >= self.max_errors:
+                        return errors
         
         if errors:
             return errors
 
-        # Cycle Detection
-        visited = set()
-        recursion_stack = set()
-        def detect_cycle(node):
-            visited.add(node)
-            recursion_stack.add(node)
-            neighbors = dag.get(node, [])
-            for neighbor in neighbors:
-                if neighbor not in visited:
-                    if detect_cycle(neighbor): return True
-                elif neighbor in recursion_stack: return True
-            recursion_stack.remove(node)
+        # Cycle Detection (iterative DFS, WHITE/GRAY/BLACK marking)
+        # Absent from `color` = WHITE (unvisited)
+        GRAY, BLACK = 1, 2
+        color: Dict[str, int] = {}
+
+        def detect_cycle(root) -> bool:
+            color[root] = GRAY
+            stack = [(root, iter(dag.get(root, [])))]
+            while stack:
+                node, neighbors = stack[-1]
+                neighbor = next(neighbors, None)
+                if neighbor is None:
+                    color[node] = BLACK
+                    stack.pop()
+                elif color.get(neighbor) == GRAY:
+                    return True
+                elif neighbor not in color:
+                    color[neighbor] = GRAY
+                    stack.append((neighbor, iter(dag.get(neighbor, []))))
             return False
 
         for node in dag.keys():
-            if node not in visited:
+            if node not in color:
                 if detect_cycle(node):
                     errors.append(ReviewError(
                         check_id="RG-DAG-004",
@@ -73,7 +73,7 @@ ARCHITECTURE_CONTRACT_SCHEMA = {
 # SELF-VERIFICATION LOGIC
 # ---------------------------------------------------------
 
-def get_schema_version_hash() -> str:
+def _derive_schema_version_hash() -> str:
     """
     Derives the schema version from the Schema AST itself.
     This prevents 'Liars Version' attacks.
@@ -85,4 +85,13 @@ def get_schema_version_hash() -> str:
     # full dictionary structure defined above.
     
     canonical_bytes = jcs.canonicalize(ARCHITECTURE_CONTRACT_SCHEMA)
-    return hashlib.sha256(canonical_bytes).hexdigest()
\ No newline at end of file
+    return hashlib.sha256(canonical_bytes).hexdigest()
+
+# The Schema AST is a module constant: derive its version exactly once.
+_SCHEMA_VERSION_HASH: str = _derive_schema_version_hash()
+
+def get_schema_version_hash() -> str:
+    """
+    Returns the schema version derived from the Schema AST at import.
+    """
+    return _SCHEMA_VERSION_HASH
\ No newline at end of file
@@ -0,0 +1,55 @@
+import sys
+import os
+import glob
+import datetime
+import enum
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import jcs
+from src.governance.loader import load_json
+from src.governance.hashing import GovernanceHasher
+from src.governance.schema import ARCHITECTURE_CONTRACT_SCHEMA
+
+class Priority(enum.IntEnum):
+    HIGH = 1
+
+# Inputs where a fast backend has diverged from jcs before
+EDGE_CASES = {
+    "int_2**53": {"n": 2 ** 53},
+    "int_2**53+1": {"n": 2 ** 53 + 1},
+    "int_-(2**53+1)": {"n": -(2 ** 53 + 1)},
+    "floats": {"a": 1.0, "b": 0.1, "c": 1e21, "d": 1e-7, "e": -0.0, "f": 123456789.125},
+    "non_bmp_keys": {"\U0001F600": 1, "ﬁ": 2, "z": 3, "é": 4},
+    "int_enum": {"p": Priority.HIGH},
+    "tuple": {"t": (1, "a", None)},
+    "datetime": {"when": datetime.datetime(2020, 1, 1)},
+}
+
+PLAN_LAYOUT = GovernanceHasher.schema_layout(ARCHITECTURE_CONTRACT_SCHEMA)
+
+def streamed(data):
+    chunks = []
+    GovernanceHasher.canonicalize_into(data, chunks.append, PLAN_LAYOUT)
+    return b"".join(chunks)
+
+def canonical_or_error(fn, data):
+    try:
+        return fn(data)
+    except (TypeError, ValueError):
+        return "ERROR"
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+cases = {os.path.basename(path): load_json(path) for path in sorted(glob.glob(os.path.join(base_dir, '*.json')))}
+cases.update(EDGE_CASES)
+
+print("="*40)
+print("CANONICALIZATION vs jcs REFERENCE")
+print("="*40)
+failures = 0
+for name, data in cases.items():
+    expected = canonical_or_error(jcs.canonicalize, data)
+    actual = canonical_or_error(GovernanceHasher.canonicalize, data)
+    ok = expected == actual == canonical_or_error(streamed, data)
+    failures += not ok
+    print(f"[{'OK' if ok else 'MISMATCH'}] {name}")
+print("="*40)
+sys.exit(1 if failures else 0)